@@ -0,0 +1,258 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled bitboard move generator and alpha-beta search.
+
+This module mirrors the bitboard functions and the evaluation in
+``othello_core.py``.  Build it in place with::
+
+    python setup.py build_ext --inplace
+
+``othello_core`` imports it when it is present and otherwise falls back
+to its pure Python implementation.  Boards are passed as ``(own, opp)``
+64-bit integers from the point of view of the side to move.
+"""
+
+from libc.stdint cimport uint64_t
+from posix.time cimport CLOCK_MONOTONIC, clock_gettime, timespec
+
+cdef extern from *:
+    int __builtin_popcountll(unsigned long long x) nogil
+    int __builtin_ctzll(unsigned long long x) nogil
+
+cdef uint64_t NOT_A = 0xFEFEFEFEFEFEFEFEULL
+cdef uint64_t NOT_H = 0x7F7F7F7F7F7F7F7FULL
+cdef uint64_t FULL = 0xFFFFFFFFFFFFFFFFULL
+cdef uint64_t CORNERS = 0x8100000000000081ULL
+cdef uint64_t X_SQUARES = 0x0042000000004200ULL
+
+cdef int WIN_SCORE = 10000
+cdef int CORNER_WEIGHT = 25
+cdef int X_SQUARE_WEIGHT = 12
+
+# Same direction order as SHIFTS in othello_core.py.
+cdef int SHIFT_AMOUNTS[8]
+cdef uint64_t SHIFT_MASKS[8]
+SHIFT_AMOUNTS[:] = [-9, -8, -7, -1, 1, 7, 8, 9]
+SHIFT_MASKS[:] = [NOT_H, FULL, NOT_A, NOT_H, NOT_A, NOT_H, FULL, NOT_A]
+
+# The move generator handles each shift amount in both directions; these
+# masks clear the squares that a left or right shift would wrap onto.
+cdef int FILL_SHIFTS[4]
+cdef uint64_t LEFT_MASKS[4]
+cdef uint64_t RIGHT_MASKS[4]
+FILL_SHIFTS[:] = [1, 7, 8, 9]
+LEFT_MASKS[:] = [NOT_A, NOT_H, FULL, NOT_A]
+RIGHT_MASKS[:] = [NOT_H, NOT_A, FULL, NOT_H]
+
+cdef int SQUARE_WEIGHTS[64]
+SQUARE_WEIGHTS[:] = [
+    100, 20,  20, 20, 20,  20, 20, 100,
+     20, -50,  0,  0,  0,  0, -50,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20, -50,  0,  0,  0,  0, -50,  20,
+    100, 20,  20, 20, 20,  20, 20, 100,
+]
+
+# Below this remaining depth moves are ordered by flip count rather than
+# by the number of replies they leave the opponent.
+cdef int MOBILITY_ORDER_DEPTH = 4
+
+# How often, in nodes, the search looks at the clock.
+cdef long CLOCK_CHECK_MASK = 4095
+
+
+cdef struct Search:
+    long nodes
+    bint has_deadline
+    double deadline
+    bint timed_out
+
+
+cdef inline double _now() noexcept nogil:
+    # Monotonic wall-clock seconds, the same kind of time as
+    # time.perf_counter(), so other busy processes do not stretch the budget.
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return ts.tv_sec + ts.tv_nsec * 1e-9
+
+
+cdef inline uint64_t _shift(uint64_t bb, int d) noexcept nogil:
+    cdef int s = SHIFT_AMOUNTS[d]
+    if s > 0:
+        return (bb << s) & SHIFT_MASKS[d]
+    return (bb >> -s) & SHIFT_MASKS[d]
+
+
+cdef inline uint64_t _fill_left(uint64_t gen, uint64_t pro, int s) noexcept nogil:
+    # Kogge-Stone occluded fill of ``gen`` through ``pro`` towards higher
+    # bits.  ``pro`` must already exclude squares a shift would wrap onto.
+    gen |= pro & (gen << s)
+    pro &= pro << s
+    gen |= pro & (gen << (2 * s))
+    pro &= pro << (2 * s)
+    gen |= pro & (gen << (4 * s))
+    return gen
+
+
+cdef inline uint64_t _fill_right(uint64_t gen, uint64_t pro, int s) noexcept nogil:
+    gen |= pro & (gen >> s)
+    pro &= pro >> s
+    gen |= pro & (gen >> (2 * s))
+    pro &= pro >> (2 * s)
+    gen |= pro & (gen >> (4 * s))
+    return gen
+
+
+cdef uint64_t _valid_moves(uint64_t own, uint64_t opp) noexcept nogil:
+    cdef uint64_t empty = ~(own | opp)
+    cdef uint64_t moves = 0
+    cdef uint64_t pro, gen
+    cdef int d, s
+    for d in range(4):
+        s = FILL_SHIFTS[d]
+        pro = opp & LEFT_MASKS[d]
+        gen = _fill_left(own, pro, s)
+        moves |= ((gen & opp) << s) & LEFT_MASKS[d]
+        pro = opp & RIGHT_MASKS[d]
+        gen = _fill_right(own, pro, s)
+        moves |= ((gen & opp) >> s) & RIGHT_MASKS[d]
+    return moves & empty
+
+
+cdef uint64_t _flips(uint64_t own, uint64_t opp, int sq) noexcept nogil:
+    cdef uint64_t placed = (<uint64_t>1) << sq
+    cdef uint64_t flips = 0
+    cdef uint64_t x
+    cdef int d
+    for d in range(8):
+        x = _shift(placed, d) & opp
+        x |= _shift(x, d) & opp
+        x |= _shift(x, d) & opp
+        x |= _shift(x, d) & opp
+        x |= _shift(x, d) & opp
+        x |= _shift(x, d) & opp
+        if _shift(x, d) & own:
+            flips |= x
+    return flips
+
+
+cdef int _evaluate(uint64_t own, uint64_t opp) noexcept nogil:
+    cdef int own_mobility = __builtin_popcountll(_valid_moves(own, opp))
+    cdef int opp_mobility = __builtin_popcountll(_valid_moves(opp, own))
+    cdef int discs = __builtin_popcountll(own) - __builtin_popcountll(opp)
+    cdef int corners, x_squares
+    if own_mobility == 0 and opp_mobility == 0:
+        if discs > 0:
+            return WIN_SCORE + discs
+        if discs < 0:
+            return -WIN_SCORE + discs
+        return 0
+    corners = __builtin_popcountll(own & CORNERS) - __builtin_popcountll(opp & CORNERS)
+    x_squares = __builtin_popcountll(own & X_SQUARES) - __builtin_popcountll(opp & X_SQUARES)
+    return (
+        discs
+        + CORNER_WEIGHT * corners
+        - X_SQUARE_WEIGHT * x_squares
+        + own_mobility
+        - opp_mobility
+    )
+
+
+cdef int _negamax(
+    Search* search, uint64_t own, uint64_t opp, int depth, int alpha, int beta
+) noexcept nogil:
+    cdef uint64_t moves, flips, placed
+    cdef int squares[64]
+    cdef uint64_t move_flips[64]
+    cdef int keys[64]
+    cdef int n = 0
+    cdef int i, j, sq, score, key
+
+    search.nodes += 1
+    if (
+        search.has_deadline
+        and (search.nodes & CLOCK_CHECK_MASK) == 0
+        and _now() > search.deadline
+    ):
+        search.timed_out = True
+    if search.timed_out:
+        return 0
+    if depth <= 0:
+        return _evaluate(own, opp)
+
+    moves = _valid_moves(own, opp)
+    if moves == 0:
+        if _valid_moves(opp, own) == 0:
+            return _evaluate(own, opp)
+        # A pass places no disc, so it does not use up a ply.
+        return -_negamax(search, opp, own, depth, -beta, -alpha)
+
+    # Insertion sort, best first: by static square weight, then by fewest
+    # opponent replies (or most flips near the leaves).
+    while moves:
+        sq = __builtin_ctzll(moves)
+        moves &= moves - 1
+        placed = (<uint64_t>1) << sq
+        flips = _flips(own, opp, sq)
+        if depth >= MOBILITY_ORDER_DEPTH:
+            key = 64 * SQUARE_WEIGHTS[sq] - __builtin_popcountll(
+                _valid_moves(opp ^ flips, own ^ flips ^ placed)
+            )
+        else:
+            key = 64 * SQUARE_WEIGHTS[sq] + __builtin_popcountll(flips)
+        j = n
+        while j > 0 and keys[j - 1] < key:
+            squares[j] = squares[j - 1]
+            move_flips[j] = move_flips[j - 1]
+            keys[j] = keys[j - 1]
+            j -= 1
+        squares[j] = sq
+        move_flips[j] = flips
+        keys[j] = key
+        n += 1
+
+    for i in range(n):
+        sq = squares[i]
+        flips = move_flips[i]
+        score = -_negamax(
+            search, opp ^ flips, own ^ flips ^ ((<uint64_t>1) << sq),
+            depth - 1, -beta, -alpha,
+        )
+        if search.timed_out:
+            return 0
+        if score > alpha:
+            alpha = score
+            if alpha >= beta:
+                break
+    return alpha
+
+
+def valid_moves_bb(uint64_t own, uint64_t opp):
+    """Return a bitboard of every square where ``own`` may legally play."""
+    return _valid_moves(own, opp)
+
+
+def flips_bb(uint64_t own, uint64_t opp, int sq):
+    """Return the discs flipped when ``own`` plays on square ``sq``."""
+    return _flips(own, opp, sq)
+
+
+def negamax(uint64_t own, uint64_t opp, int depth, int alpha, int beta, double budget=-1.0):
+    """Return the alpha-beta value of the position for the side to move.
+
+    A non-negative ``budget`` limits the search to that many seconds of
+    wall-clock time; ``TimeoutError`` is raised when it runs out.
+    """
+    cdef Search search
+    cdef int score
+    search.nodes = 0
+    search.timed_out = False
+    search.has_deadline = budget >= 0
+    search.deadline = _now() + budget
+    with nogil:
+        score = _negamax(&search, own, opp, depth, alpha, beta)
+    if search.timed_out:
+        raise TimeoutError
+    return score
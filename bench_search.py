@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Time the parallel root search against the sequential one.
+
+    python bench_search.py [depth] [positions]
+
+Both searches run over the same midgame positions, and the table and
+move cache of this process are cleared before each one.  The workers
+keep theirs between positions, which only matters where positions
+share subtrees.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import List, Tuple
+
+import othello_core
+from othello_core import BLACK, BoardBB, init_board, make_move, opponent, valid_moves
+
+
+def midgame_positions(count: int, seed: int = 1) -> List[Tuple[BoardBB, str]]:
+    """Return ``count`` positions reached by random play from the start."""
+    rng = random.Random(seed)
+    positions: List[Tuple[BoardBB, str]] = []
+    while len(positions) < count:
+        board, player = init_board(), BLACK
+        for _ in range(rng.randrange(16, 28)):
+            moves = valid_moves(board, player)
+            if moves:
+                move = rng.choice(sorted(moves))
+                board = make_move(board, player, move, moves[move])
+            player = opponent(player)
+        if len(valid_moves(board, player)) > 1:
+            positions.append((board, player))
+    return positions
+
+
+def time_search(positions: List[Tuple[BoardBB, str]], depth: int, workers: int) -> float:
+    """Return the seconds taken to search every position to ``depth``."""
+    othello_core.SEARCH_WORKERS = workers
+    start = time.perf_counter()
+    for board, player in positions:
+        othello_core.transposition_table.clear()
+        valid_moves.cache_clear()
+        othello_core.negamax_root(board, player, depth, parallel=workers > 1)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    workers = max(min(othello_core.USABLE_CPUS, othello_core.MAX_SEARCH_WORKERS), 2)
+    positions = midgame_positions(count)
+    # Start the pool before timing so that its start-up is not counted.
+    othello_core.SEARCH_WORKERS = workers
+    othello_core._root_executor()
+    sequential = time_search(positions, depth, 1)
+    parallel = time_search(positions, depth, workers)
+    print(f"depth {depth}, {count} positions")
+    print(f"sequential:          {sequential:.2f} s")
+    print(f"parallel, {workers} workers: {parallel:.2f} s ({sequential / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,700 @@
+"""Othello (Reversi) engine shared by the game front-ends.
+
+The position is kept as two 64-bit integer bitboards, one per side, so
+legal moves can be found with a handful of shifts and masks instead of
+a square-by-square scan.  The computer opponent runs a negamax search
+with alpha-beta pruning and a transposition table, deepening one ply at
+a time until its time budget runs out.  Positions at the search horizon
+are scored by disc count, corner and X-square ownership and mobility.
+
+Only the Python standard library is required.  If numba is installed
+the move generator is compiled with it.  If the optional Cython core
+(``_othello_core``) has been built, the last few plies of each line
+are searched there, below the part of the tree kept in the table.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # the pure Python move generator is used instead
+    np = None
+    njit = None
+
+try:
+    import _othello_core
+except ImportError:  # compiled search core; see setup.py
+    _othello_core = None
+
+__all__ = [
+    "BLACK",
+    "BOARD_SIZE",
+    "CELL_SYMBOLS",
+    "EMPTY",
+    "TIME_LIMIT",
+    "WHITE",
+    "BoardBB",
+    "Move",
+    "MoveFlips",
+    "choose_move_id",
+    "init_board",
+    "make_move",
+    "on_board",
+    "opponent",
+    "scores",
+    "to_cells",
+    "valid_moves",
+]
+
+BOARD_SIZE = 8
+EMPTY = "."
+BLACK = "B"
+WHITE = "W"
+
+Move = Tuple[int, int]
+# Each side's discs are stored as a 64-bit integer.  Bit ``x * 8 + y`` is
+# set when the side owns the square in row ``x``, column ``y``.
+BoardBB = Tuple[int, int]  # (black, white)
+MoveFlips = Mapping[Move, int]
+
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_A = 0xFEFEFEFEFEFEFEFE  # every square except column A
+NOT_H = 0x7F7F7F7F7F7F7F7F  # every square except column H
+
+# (row step, column step) for each of the eight directions.
+DIRECTIONS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1),
+)
+
+# The same directions as (shift, mask) pairs on a bitboard.  A positive
+# shift moves discs towards higher bit indices; the mask removes discs
+# that wrapped around from one edge of the board to the other.
+SHIFTS: Tuple[Tuple[int, int], ...] = (
+    (-9, NOT_H), (-8, FULL), (-7, NOT_A),
+    (-1, NOT_H),             (1, NOT_A),
+    (7, NOT_H),  (8, FULL),  (9, NOT_A),
+)
+
+# The four centre discs of the starting position.
+START_BLACK = 0x0000000810000000  # E4 and D5
+START_WHITE = 0x0000001008000000  # D4 and E5
+
+
+def init_board() -> BoardBB:
+    """Create the initial Othello board."""
+    return START_BLACK, START_WHITE
+
+
+def square_bit(x: int, y: int) -> int:
+    return 1 << (x * BOARD_SIZE + y)
+
+
+# Codes used for the flat, one-byte-per-square copy of the board that is
+# built for display.  CELL_SYMBOLS maps each code to its printed symbol.
+CELL_EMPTY, CELL_BLACK, CELL_WHITE = 0, 1, 2
+CELL_SYMBOLS = (EMPTY, BLACK, WHITE)
+
+
+def to_cells(board: BoardBB) -> bytearray:
+    """Expand the bitboards into one cell code per square, row by row."""
+    cells = bytearray(BOARD_SIZE * BOARD_SIZE)
+    for bb, code in zip(board, (CELL_BLACK, CELL_WHITE)):
+        while bb:
+            low = bb & -bb
+            bb ^= low
+            cells[low.bit_length() - 1] = code
+    return cells
+
+
+def on_board(x: int, y: int) -> bool:
+    return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+
+
+def opponent(player: str) -> str:
+    return WHITE if player == BLACK else BLACK
+
+
+def split(board: BoardBB, player: str) -> Tuple[int, int]:
+    """Return the ``(own, opp)`` bitboards from ``player``'s point of view."""
+    black, white = board
+    return (black, white) if player == BLACK else (white, black)
+
+
+def valid_moves_bb(own: int, opp: int) -> int:
+    """Return a bitboard of every square where ``own`` may legally play.
+
+    For each direction our discs are flooded through the adjacent opponent
+    discs with a Kogge-Stone fill: shifts of 1, 2 and 4 steps cover runs
+    of up to seven discs in three rounds.  The empty square beyond a run
+    of at least one opponent disc is a legal move.
+    """
+    empty = ~(own | opp) & FULL
+    moves = 0
+    for s, mask in SHIFTS:
+        pro = opp & mask
+        if s > 0:
+            gen = own | (pro & (own << s))
+            pro &= pro << s
+            gen |= pro & (gen << (2 * s))
+            pro &= pro << (2 * s)
+            gen |= pro & (gen << (4 * s))
+            moves |= ((gen & opp) << s) & mask
+        else:
+            s = -s
+            gen = own | (pro & (own >> s))
+            pro &= pro >> s
+            gen |= pro & (gen >> (2 * s))
+            pro &= pro >> (2 * s)
+            gen |= pro & (gen >> (4 * s))
+            moves |= ((gen & opp) >> s) & mask
+    return moves & empty
+
+
+def _build_rays() -> List[Tuple[Tuple[int, ...], ...]]:
+    """List, for every square, the squares along each direction as bits.
+
+    Rays shorter than two squares are left out: a capture needs at least
+    one opponent disc followed by one of our own.
+    """
+    rays = []
+    for x in range(BOARD_SIZE):
+        for y in range(BOARD_SIZE):
+            square_rays = []
+            for dx, dy in DIRECTIONS:
+                ray = []
+                nx, ny = x + dx, y + dy
+                while on_board(nx, ny):
+                    ray.append(square_bit(nx, ny))
+                    nx += dx
+                    ny += dy
+                if len(ray) >= 2:
+                    square_rays.append(tuple(ray))
+            rays.append(tuple(square_rays))
+    return rays
+
+
+RAYS = _build_rays()
+
+
+def flips_bb(own: int, opp: int, sq: int) -> int:
+    """Return the discs flipped when ``own`` plays on square ``sq``."""
+    flips = 0
+    for ray in RAYS[sq]:
+        run = 0
+        for bit in ray:
+            if opp & bit:
+                run |= bit
+            else:
+                if run and own & bit:
+                    flips |= run
+                break
+    return flips
+
+
+VALID_MOVES_CACHE_SIZE = 1 << 16  # positions whose legal moves are remembered
+# One shared (row, column) tuple per square, so cached move maps do not
+# each hold their own copies.
+SQUARE_MOVES: Tuple[Move, ...] = tuple(
+    divmod(sq, BOARD_SIZE) for sq in range(BOARD_SIZE * BOARD_SIZE)
+)
+
+# The pure Python versions, kept so that the compiled ones can be
+# checked against them.
+valid_moves_bb_py = valid_moves_bb
+flips_bb_py = flips_bb
+
+if _othello_core is not None:
+    valid_moves_bb = _othello_core.valid_moves_bb  # noqa: F811
+    flips_bb = _othello_core.flips_bb  # noqa: F811
+
+
+if njit is not None:
+    DIR = np.array(DIRECTIONS, np.int8)
+
+    @njit(cache=True, nogil=True)
+    def valid_moves_nb(cells, player):
+        """Find legal moves on an int8 array of cell codes.
+
+        Returns a bitmask of legal squares and, for each square, a bitmask of
+        the discs that playing there flips.  Both use int64, so bit 63 comes
+        back as the sign bit.
+        """
+        opp = 3 - player
+        moves = np.int64(0)
+        flips = np.zeros(BOARD_SIZE * BOARD_SIZE, np.int64)
+        for x in range(BOARD_SIZE):
+            for y in range(BOARD_SIZE):
+                sq = x * BOARD_SIZE + y
+                if cells[sq] != CELL_EMPTY:
+                    continue
+                for d in range(8):
+                    dx = DIR[d, 0]
+                    dy = DIR[d, 1]
+                    nx = x + dx
+                    ny = y + dy
+                    run = np.int64(0)
+                    while (
+                        0 <= nx < BOARD_SIZE
+                        and 0 <= ny < BOARD_SIZE
+                        and cells[nx * BOARD_SIZE + ny] == opp
+                    ):
+                        run |= np.int64(1) << (nx * BOARD_SIZE + ny)
+                        nx += dx
+                        ny += dy
+                    if (
+                        run
+                        and 0 <= nx < BOARD_SIZE
+                        and 0 <= ny < BOARD_SIZE
+                        and cells[nx * BOARD_SIZE + ny] == player
+                    ):
+                        flips[sq] |= run
+                if flips[sq]:
+                    moves |= np.int64(1) << sq
+        return moves, flips
+
+    def _valid_moves_jit(board: BoardBB, player: str) -> MoveFlips:
+        cells = np.frombuffer(to_cells(board), np.int8)
+        code = CELL_BLACK if player == BLACK else CELL_WHITE
+        candidates, flips = valid_moves_nb(cells, code)
+        candidates = int(candidates) & FULL
+        flip_list = flips.tolist()
+        moves: Dict[Move, int] = {}
+        while candidates:
+            placed = candidates & -candidates
+            candidates ^= placed
+            sq = placed.bit_length() - 1
+            moves[SQUARE_MOVES[sq]] = flip_list[sq] & FULL
+        return moves
+
+
+@lru_cache(maxsize=VALID_MOVES_CACHE_SIZE)
+def valid_moves(board: BoardBB, player: str) -> MoveFlips:
+    """Return a mapping of valid moves to the bitboard of discs flipped.
+
+    Results are cached per position, since the game loop and successive
+    iterations of the search ask for the same positions again; the
+    mapping is read-only because it is shared between callers.  When
+    numba is installed, and the compiled core is not, the work is done by
+    the ``valid_moves_nb`` kernel.  The mobility counts in ``evaluate``
+    and ``ordered_moves`` still use ``valid_moves_bb``: the kernel needs
+    the board as cells, and building them costs more than the bitboard
+    fill itself.
+    """
+    if njit is not None and _othello_core is None:
+        return MappingProxyType(_valid_moves_jit(board, player))
+    own, opp = split(board, player)
+    moves: Dict[Move, int] = {}
+    candidates = valid_moves_bb(own, opp)
+    while candidates:
+        placed = candidates & -candidates
+        candidates ^= placed
+        sq = placed.bit_length() - 1
+        moves[SQUARE_MOVES[sq]] = flips_bb(own, opp, sq)
+    return MappingProxyType(moves)
+
+
+def make_move(board: BoardBB, player: str, move: Move, flips: int) -> BoardBB:
+    """Return the board after placing a disc and flipping the captured discs."""
+    own, opp = split(board, player)
+    own ^= square_bit(*move) | flips
+    opp ^= flips
+    return (own, opp) if player == BLACK else (opp, own)
+
+
+def greedy_choice(moves: MoveFlips) -> Optional[Move]:
+    """Choose the move that flips the most discs."""
+    if not moves:
+        return None
+    best_moves: List[Move] = []
+    max_flips = -1
+    for move, flips in moves.items():
+        count = flips.bit_count()
+        if count > max_flips:
+            max_flips = count
+            best_moves = [move]
+        elif count == max_flips:
+            best_moves.append(move)
+    return random.choice(best_moves)
+
+
+def scores(board: BoardBB) -> Tuple[int, int]:
+    black, white = board
+    return black.bit_count(), white.bit_count()
+
+
+TIME_LIMIT = 1.0  # seconds the computer may think per move
+# Below this remaining depth, ordering by opponent mobility costs more
+# than the cutoffs it gains, so moves are ordered by flip count instead.
+MOBILITY_ORDER_DEPTH = 4
+# Root searches can be split across SEARCH_WORKERS worker processes.
+# This is off by default: in the measurements so far the pool has cost
+# more than it saved.  Check with bench_search.py before raising it.
+SEARCH_WORKERS = 1
+# Every worker keeps its own transposition table and valid_moves cache,
+# so the pool is kept small.
+MAX_SEARCH_WORKERS = 4
+if hasattr(os, "sched_getaffinity"):
+    # Only the CPUs this process may run on, not every CPU in the machine.
+    USABLE_CPUS = len(os.sched_getaffinity(0))
+else:
+    USABLE_CPUS = os.cpu_count() or 1
+# A deepening iteration only goes to the pool once the previous one took
+# this many seconds; shorter searches are dominated by its overhead.
+PARALLEL_MIN_SECONDS = 0.1
+# With the compiled core, nodes with more plies than this left are
+# searched in Python so that they use the transposition table; shallower
+# subtrees are handed to the core, which has no table.
+NATIVE_SEARCH_DEPTH = 5
+SCORE_INF = 1_000_000
+WIN_SCORE = 10_000
+CORNERS = 0x8100000000000081
+X_SQUARES = 0x0042000000004200  # diagonally next to a corner
+CORNER_WEIGHT = 25
+X_SQUARE_WEIGHT = 12
+
+# Static value of each square, used to order moves before searching them.
+SQUARE_WEIGHTS: Tuple[int, ...] = (
+    100, 20,  20, 20, 20,  20, 20, 100,
+     20, -50,  0,  0,  0,  0, -50,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20,  0,   0,  0,  0,  0,   0,  20,
+     20, -50,  0,  0,  0,  0, -50,  20,
+    100, 20,  20, 20, 20,  20, 20, 100,
+)
+
+
+def evaluate(own: int, opp: int) -> int:
+    """Score the position from the point of view of the side owning ``own``.
+
+    Every term is a population count of a masked bitboard.
+    """
+    own_mobility = valid_moves_bb(own, opp).bit_count()
+    opp_mobility = valid_moves_bb(opp, own).bit_count()
+    discs = own.bit_count() - opp.bit_count()
+    if not own_mobility and not opp_mobility:
+        if discs > 0:
+            return WIN_SCORE + discs
+        if discs < 0:
+            return -WIN_SCORE + discs
+        return 0
+    corners = (own & CORNERS).bit_count() - (opp & CORNERS).bit_count()
+    x_squares = (own & X_SQUARES).bit_count() - (opp & X_SQUARES).bit_count()
+    return (
+        discs
+        + CORNER_WEIGHT * corners
+        - X_SQUARE_WEIGHT * x_squares
+        + own_mobility
+        - opp_mobility
+    )
+
+
+# Transposition table entries are (depth, score, flag, best move).  The
+# flag records whether the score is exact or only a bound on the value.
+# Entries are keyed by the position itself, (board, player): the tuple is
+# cheaper to build and hash than a Zobrist key is to update, and it
+# cannot collide.
+EXACT, LOWER, UPPER = 0, 1, 2
+TTKey = Tuple[BoardBB, str]
+TTEntry = Tuple[int, int, int, Optional[Move]]
+TT_MAX_ENTRIES = 1 << 17
+transposition_table: Dict[TTKey, TTEntry] = {}
+_table_min_discs = 0  # disc count the table was last pruned to
+
+
+def drop_stale_entries(discs: int) -> None:
+    """Remove table entries for positions with fewer than ``discs`` discs.
+
+    Discs are never taken off the board, so once the game has ``discs``
+    discs those positions cannot come up again.
+    """
+    global transposition_table, _table_min_discs
+    if discs <= _table_min_discs:
+        return
+    # Rebuilt rather than deleted from, since a dict never shrinks.
+    transposition_table = {
+        key: entry
+        for key, entry in transposition_table.items()
+        if (key[0][0] | key[0][1]).bit_count() >= discs
+    }
+    _table_min_discs = discs
+
+
+def ordered_moves(
+    board: BoardBB,
+    player: str,
+    moves: MoveFlips,
+    first: Optional[Move] = None,
+    by_mobility: bool = True,
+) -> List[Tuple[Move, int]]:
+    """Sort moves so the most promising ones are searched first.
+
+    Moves on high-value squares come first.  Among equally weighted
+    squares, those that leave the opponent the fewest replies are
+    preferred when ``by_mobility`` is true, and those that flip the most
+    discs otherwise.  ``first``, when it is a legal move, is placed ahead
+    of all others.
+    """
+    own, opp = split(board, player)
+
+    def key(item: Tuple[Move, int]) -> Tuple[int, int]:
+        (x, y), flips = item
+        sq = x * BOARD_SIZE + y
+        if by_mobility:
+            replies = valid_moves_bb(opp ^ flips, own ^ flips ^ (1 << sq))
+            return -SQUARE_WEIGHTS[sq], replies.bit_count()
+        return -SQUARE_WEIGHTS[sq], -flips.bit_count()
+
+    candidates = sorted(moves.items(), key=key)
+    if first in moves:
+        candidates.remove((first, moves[first]))
+        candidates.insert(0, (first, moves[first]))
+    return candidates
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget has been used up."""
+
+
+def negamax(
+    board: BoardBB,
+    player: str,
+    depth: int,
+    alpha: int,
+    beta: int,
+    deadline: Optional[float] = None,
+) -> int:
+    """Return the alpha-beta value of the position for ``player``.
+
+    Results are stored in and reused from the transposition table.  When
+    the compiled core is available, subtrees of at most
+    ``NATIVE_SEARCH_DEPTH`` plies are searched there instead.
+    """
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SearchTimeout
+    if _othello_core is not None and depth <= NATIVE_SEARCH_DEPTH:
+        own, opp = split(board, player)
+        budget = -1.0 if deadline is None else max(deadline - time.perf_counter(), 0.0)
+        try:
+            return _othello_core.negamax(own, opp, depth, alpha, beta, budget)
+        except TimeoutError:
+            raise SearchTimeout from None
+    if depth <= 0:
+        return evaluate(*split(board, player))
+
+    key = (board, player)
+    alpha_orig = alpha
+    tt_move: Optional[Move] = None
+    entry = transposition_table.get(key)
+    if entry is not None:
+        entry_depth, score, flag, tt_move = entry
+        if entry_depth >= depth:
+            if flag == EXACT:
+                return score
+            if flag == LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+    moves = valid_moves(board, player)
+    if not moves:
+        own, opp = split(board, player)
+        if not valid_moves_bb(opp, own):
+            return evaluate(own, opp)
+        # A pass places no disc, so it does not use up a ply.
+        return -negamax(board, opponent(player), depth, -beta, -alpha, deadline)
+
+    best_move: Optional[Move] = None
+    by_mobility = depth >= MOBILITY_ORDER_DEPTH
+    for move, flips in ordered_moves(board, player, moves, tt_move, by_mobility):
+        child = make_move(board, player, move, flips)
+        score = -negamax(child, opponent(player), depth - 1, -beta, -alpha, deadline)
+        if score > alpha:
+            alpha = score
+            best_move = move
+            if alpha >= beta:
+                break
+
+    if alpha <= alpha_orig:
+        flag = UPPER
+    elif alpha >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    if len(transposition_table) >= TT_MAX_ENTRIES:
+        transposition_table.clear()
+    transposition_table[key] = (depth, alpha, flag, best_move)
+    return alpha
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _root_executor() -> ProcessPoolExecutor:
+    """Return the worker pool, starting it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=SEARCH_WORKERS)
+    return _executor
+
+
+def _discard_executor() -> None:
+    """Drop the worker pool so that the next parallel search starts a new one."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _search_child(
+    board: BoardBB,
+    player: str,
+    depth: int,
+    alpha: int,
+    beta: int,
+    wall_deadline: Optional[float],
+) -> Optional[int]:
+    """Worker entry point: search one root child, or None if time ran out.
+
+    The deadline is passed as ``time.time()``, which unlike
+    ``time.perf_counter()`` means the same thing in every process.
+    """
+    drop_stale_entries((board[0] | board[1]).bit_count())
+    deadline = None
+    if wall_deadline is not None:
+        deadline = time.perf_counter() + (wall_deadline - time.time())
+    try:
+        return negamax(board, player, depth, alpha, beta, deadline)
+    except SearchTimeout:
+        return None
+
+
+def _negamax_root_parallel(
+    board: BoardBB,
+    player: str,
+    depth: int,
+    candidates: List[Tuple[Move, int]],
+    deadline: Optional[float],
+) -> Move:
+    """Search the root moves across the worker pool.
+
+    The first move is searched here to get a bound; the remaining moves
+    are then searched in parallel, each with that bound as its window, as
+    in the Young Brothers Wait Concept.
+    """
+    (best_move, flips), rest = candidates[0], candidates[1:]
+    child = make_move(board, player, best_move, flips)
+    best_score = -negamax(child, opponent(player), depth - 1, -SCORE_INF, SCORE_INF, deadline)
+
+    wall_deadline = None
+    if deadline is not None:
+        wall_deadline = time.time() + (deadline - time.perf_counter())
+    executor = _root_executor()
+    futures: List[Tuple[Move, Future]] = [
+        (
+            move,
+            executor.submit(
+                _search_child,
+                make_move(board, player, move, flips),
+                opponent(player),
+                depth - 1,
+                -SCORE_INF,
+                -best_score,
+                wall_deadline,
+            ),
+        )
+        for move, flips in rest
+    ]
+    try:
+        for move, future in futures:
+            result = future.result()
+            if result is None:
+                raise SearchTimeout
+            if -result > best_score:
+                best_move, best_score = move, -result
+    finally:
+        for _, future in futures:
+            future.cancel()
+    return best_move
+
+
+def negamax_root(
+    board: BoardBB,
+    player: str,
+    depth: int,
+    first: Optional[Move] = None,
+    deadline: Optional[float] = None,
+    parallel: bool = False,
+) -> Optional[Move]:
+    """Return the best move for ``player`` found by a ``depth``-ply search.
+
+    ``first`` is searched before every other move; passing the best move of
+    a shallower search gives alpha-beta a tight bound early on.  With
+    ``parallel`` the moves are searched in the worker pool, when it has
+    more than one worker.  If a worker dies, the pool is discarded and the
+    search is redone here.
+    """
+    moves = valid_moves(board, player)
+    if depth < 1:
+        return greedy_choice(moves)
+    candidates = ordered_moves(board, player, moves, first)
+    if parallel and SEARCH_WORKERS > 1 and len(candidates) > 1:
+        try:
+            return _negamax_root_parallel(board, player, depth, candidates, deadline)
+        except BrokenProcessPool:
+            _discard_executor()
+    best_move: Optional[Move] = None
+    alpha = -SCORE_INF
+    for move, flips in candidates:
+        child = make_move(board, player, move, flips)
+        score = -negamax(child, opponent(player), depth - 1, -SCORE_INF, -alpha, deadline)
+        if best_move is None or score > alpha:
+            best_move, alpha = move, score
+    return best_move
+
+
+def choose_move_id(board: BoardBB, player: str, time_limit: float = TIME_LIMIT) -> Optional[Move]:
+    """Pick a move by iterative deepening within ``time_limit`` seconds.
+
+    Depths 1, 2, 3, ... are searched in turn and the move from the deepest
+    completed search is returned.  A search that runs past the deadline is
+    abandoned.  Passes do not count as plies, so a search as deep as the
+    number of empty squares reaches the end of every line; deepening stops
+    there, because deeper searches cannot change the result.  Once an
+    iteration has taken ``PARALLEL_MIN_SECONDS``, the next ones may use
+    the worker pool.
+    """
+    start = time.perf_counter()
+    deadline = start + time_limit * 0.95
+    best_move = greedy_choice(valid_moves(board, player))
+    black, white = board
+    discs = (black | white).bit_count()
+    drop_stale_entries(discs)
+    empties = BOARD_SIZE * BOARD_SIZE - discs
+    parallel = False
+    for depth in range(1, empties + 1):
+        started = time.perf_counter()
+        try:
+            best_move = negamax_root(board, player, depth, best_move, deadline, parallel)
+        except SearchTimeout:
+            break
+        finished = time.perf_counter()
+        if finished > deadline:
+            break
+        parallel = finished - started >= PARALLEL_MIN_SECONDS
+    return best_move
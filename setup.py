@@ -0,0 +1,20 @@
+"""Build the optional compiled search core.
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="othello",
+    ext_modules=cythonize(
+        [
+            Extension(
+                "_othello_core",
+                ["_othello_core.pyx"],
+                extra_compile_args=["-O3", "-march=native"],
+            )
+        ]
+    ),
+)
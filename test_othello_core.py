@@ -0,0 +1,121 @@
+"""Check the compiled move generators and search against the Python ones.
+
+    python -m unittest test_othello_core
+
+The Cython core and the numba kernel each repeat the move generator,
+and the core also repeats the evaluation and the search.  These tests
+play random games and compare the results on every position reached.
+They are skipped when the extension or numba is not available.
+"""
+
+from __future__ import annotations
+
+import random
+import unittest
+from typing import List, Tuple
+from unittest import mock
+
+import othello_core
+from othello_core import (
+    BLACK,
+    CELL_BLACK,
+    CELL_WHITE,
+    FULL,
+    SCORE_INF,
+    BoardBB,
+    flips_bb_py,
+    init_board,
+    make_move,
+    opponent,
+    split,
+    to_cells,
+    valid_moves,
+    valid_moves_bb_py,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def random_positions(count: int, seed: int) -> List[Tuple[BoardBB, str]]:
+    """Return the positions met while playing random games, passes included."""
+    rng = random.Random(seed)
+    positions: List[Tuple[BoardBB, str]] = []
+    board, player = init_board(), BLACK
+    while len(positions) < count:
+        positions.append((board, player))
+        own, opp = split(board, player)
+        moves = valid_moves_bb_py(own, opp)
+        if moves:
+            sq = rng.choice([sq for sq in range(64) if moves >> sq & 1])
+            board = make_move(board, player, divmod(sq, 8), flips_bb_py(own, opp, sq))
+        elif not valid_moves_bb_py(opp, own):
+            board = init_board()
+        player = opponent(player)
+    return positions
+
+
+def python_negamax(board: BoardBB, player: str, depth: int) -> int:
+    """Run the search with the compiled core switched off."""
+    with mock.patch.multiple(
+        othello_core,
+        _othello_core=None,
+        valid_moves_bb=valid_moves_bb_py,
+        flips_bb=flips_bb_py,
+    ):
+        othello_core.transposition_table.clear()
+        valid_moves.cache_clear()
+        try:
+            return othello_core.negamax(board, player, depth, -SCORE_INF, SCORE_INF)
+        finally:
+            valid_moves.cache_clear()
+
+
+@unittest.skipIf(othello_core._othello_core is None, "_othello_core is not built")
+class CompiledCoreTest(unittest.TestCase):
+    def test_valid_moves_bb(self) -> None:
+        core = othello_core._othello_core
+        for board, player in random_positions(2000, seed=1):
+            own, opp = split(board, player)
+            self.assertEqual(core.valid_moves_bb(own, opp), valid_moves_bb_py(own, opp))
+
+    def test_flips_bb(self) -> None:
+        core = othello_core._othello_core
+        for board, player in random_positions(2000, seed=2):
+            own, opp = split(board, player)
+            moves = valid_moves_bb_py(own, opp)
+            for sq in range(64):
+                if moves >> sq & 1:
+                    self.assertEqual(core.flips_bb(own, opp, sq), flips_bb_py(own, opp, sq))
+
+    def test_negamax(self) -> None:
+        core = othello_core._othello_core
+        for board, player in random_positions(60, seed=3)[::3]:
+            own, opp = split(board, player)
+            for depth in (1, 2, 4):
+                with self.subTest(board=board, player=player, depth=depth):
+                    self.assertEqual(
+                        core.negamax(own, opp, depth, -SCORE_INF, SCORE_INF),
+                        python_negamax(board, player, depth),
+                    )
+
+
+@unittest.skipIf(getattr(othello_core, "njit", None) is None, "numba is not installed")
+class NumbaKernelTest(unittest.TestCase):
+    def test_valid_moves_nb(self) -> None:
+        for board, player in random_positions(2000, seed=4):
+            own, opp = split(board, player)
+            cells = np.frombuffer(to_cells(board), np.int8)
+            code = CELL_BLACK if player == BLACK else CELL_WHITE
+            moves, flips = othello_core.valid_moves_nb(cells, code)
+            expected = valid_moves_bb_py(own, opp)
+            self.assertEqual(int(moves) & FULL, expected)
+            for sq in range(64):
+                if expected >> sq & 1:
+                    self.assertEqual(int(flips[sq]) & FULL, flips_bb_py(own, opp, sq))
+
+
+if __name__ == "__main__":
+    unittest.main()